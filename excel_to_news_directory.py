@@ -2,9 +2,72 @@ import pandas as pd
 import json
 import sys
 import os
-from datetime import datetime
+from datetime import date, datetime
+import heapq
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from html import escape
+from operator import itemgetter
 from pathlib import Path
+from openpyxl import load_workbook
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this many selected articles, process start-up costs more than it saves
+PARALLEL_MIN_ARTICLES = 2000
+
+# Patterns used on every article, compiled once at import time
+_STRIP_RE = re.compile(r'[^\w\s-]')
+_DASH_RE = re.compile(r'[-\s]+')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\n+')
+_EMPH_RE = re.compile(r'\b(What Happened|Why It Matters|Price Action|EXCLUSIVE|Breaking|Update)\b', re.IGNORECASE)
+
+# ASCII fast path for clean_filename: one translate pass lowercases, drops
+# disallowed characters and turns separators into spaces for split()
+_FILENAME_TABLE = str.maketrans({
+    c: ' ' if _DASH_RE.fullmatch(c) else None if _STRIP_RE.fullmatch(c) else c.lower()
+    for c in map(chr, range(128))
+})
+
+# Exactly the ISO shapes the strptime formats below accept; fromisoformat on
+# its own is wider (any date/time separator, week dates, time zones)
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2}:\d{2})?', re.ASCII)
+
+# Supported date formats grouped by the shape of string they accept, in the
+# order they are tried. The shapes are mutually exclusive, so a single regex
+# match picks the formats worth handing to strptime.
+_DATE_SHAPES = [
+    (re.compile(r'\d{4}-\d{1,2}-\s?\d{1,2}'), (
+        '%Y-%m-%d',           # 2025-08-06
+    )),
+    (re.compile(r'\s?\d{1,2}/\s?\d{1,2}/\d{4}'), (
+        '%m/%d/%Y',           # 08/06/2025
+        '%d/%m/%Y',           # 06/08/2025
+    )),
+    (re.compile(r'\d{4}/\d{1,2}/\s?\d{1,2}'), (
+        '%Y/%m/%d',           # 2025/08/06
+    )),
+    (re.compile(r'[^\W\d_]+\s+\s?\d{1,2},?\s+\d{4}'), (
+        '%B %d, %Y',          # August 06, 2025
+        '%B %d %Y',           # August 06 2025
+        '%b %d, %Y',          # Aug 06, 2025
+        '%b %d %Y',           # Aug 06 2025
+    )),
+    (re.compile(r'\s?\d{1,2}\s+[^\W\d_]+\s+\d{4}'), (
+        '%d %B %Y',           # 06 August 2025
+        '%d %b %Y',           # 06 Aug 2025
+    )),
+    (re.compile(r'\d{4}-\d{1,2}-\s?\d{1,2}\s+\d{1,2}:\d{1,2}:\d{1,2}'), (
+        '%Y-%m-%d %H:%M:%S', # 2025-08-06 14:30:00
+    )),
+    (re.compile(r'\s?\d{1,2}/\s?\d{1,2}/\d{4}\s+\d{1,2}:\d{1,2}:\d{1,2}'), (
+        '%m/%d/%Y %H:%M:%S', # 08/06/2025 14:30:00
+    )),
+]
 
 def load_config(config_file="config.json"):
     """
@@ -59,6 +122,9 @@ def get_default_config():
                 "medium_threshold": 100
             }
         },
+        "input_settings": {
+            "formula_values": True
+        },
         "output_settings": {
             "default_output_directory": "news-articles",
             "create_summary": True,
@@ -78,9 +144,14 @@ def clean_filename(title, max_length=50):
         str: Cleaned filename-safe string
     """
     # Remove special characters and replace spaces with hyphens
-    cleaned = re.sub(r'[^\w\s-]', '', title)
-    cleaned = re.sub(r'[-\s]+', '-', cleaned)
-    cleaned = cleaned.strip('-')
+    if title.isascii():
+        cleaned = '-'.join(title.translate(_FILENAME_TABLE).split())
+    else:
+        # \w and \s are Unicode-aware, so keep the regex path here; lowering
+        # is left until after the cut, since it can change non-ASCII lengths
+        cleaned = _STRIP_RE.sub('', title)
+        cleaned = _DASH_RE.sub('-', cleaned)
+        cleaned = cleaned.strip('-')
     
     # Truncate if too long
     if len(cleaned) > max_length:
@@ -88,57 +159,64 @@ def clean_filename(title, max_length=50):
     
     return cleaned.lower()
 
-def format_date_for_filename(date_str):
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_str):
     """
-    Format date string for filename use.
+    Parse a date string in one of the supported formats.
+    
+    Cached because news sheets repeat the same few dates across many rows.
     
     Args:
         date_str (str): Date string in various formats
     
     Returns:
-        str: Formatted date string (YYYY-MM-DD)
+        datetime: Parsed date, or None if no format matches
     """
-    try:
-        # Try to parse the date
-        if isinstance(date_str, str):
-            # Handle different date formats including month names
-            date_formats = [
-                '%Y-%m-%d',           # 2025-08-06
-                '%m/%d/%Y',           # 08/06/2025
-                '%d/%m/%Y',           # 06/08/2025
-                '%Y/%m/%d',           # 2025/08/06
-                '%B %d, %Y',          # August 06, 2025
-                '%B %d %Y',           # August 06 2025
-                '%b %d, %Y',          # Aug 06, 2025
-                '%b %d %Y',           # Aug 06 2025
-                '%d %B %Y',           # 06 August 2025
-                '%d %b %Y',           # 06 Aug 2025
-                '%Y-%m-%d %H:%M:%S', # 2025-08-06 14:30:00
-                '%m/%d/%Y %H:%M:%S', # 08/06/2025 14:30:00
-            ]
-            
-            for fmt in date_formats:
+    # ISO dates are the common case; fromisoformat parses them in C without
+    # raising through the strptime cascade below
+    if _ISO_DATE_RE.fullmatch(date_str):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
+    # Only try the formats whose shape matches, so strings in an unsupported
+    # shape never raise through strptime
+    for shape, formats in _DATE_SHAPES:
+        if shape.fullmatch(date_str):
+            for fmt in formats:
                 try:
-                    parsed_date = datetime.strptime(date_str, fmt)
-                    return parsed_date.strftime('%Y-%m-%d')
+                    return datetime.strptime(date_str, fmt)
                 except ValueError:
                     continue
-        
-        # If it's already a datetime object
-        if isinstance(date_str, datetime):
-            return date_str.strftime('%Y-%m-%d')
-        
-        # If it's a date object
-        if hasattr(date_str, 'strftime'):
-            return date_str.strftime('%Y-%m-%d')
-            
-    except Exception:
-        pass
+            break
+    
+    return None
+
+def parse_date(date_value):
+    """
+    Parse a Date cell into a datetime.
+    
+    Args:
+        date_value: Cell value (string in various formats, datetime or date)
+    
+    Returns:
+        datetime: Parsed date, or None if the value cannot be interpreted
+    """
+    if isinstance(date_value, str):
+        return _parse_date_string(date_value)
+    
+    # If it's already a datetime object
+    if isinstance(date_value, datetime):
+        return date_value
+    
+    # If it's a date object
+    if isinstance(date_value, date):
+        return datetime(date_value.year, date_value.month, date_value.day)
     
-    # Default to today's date if parsing fails
-    return datetime.now().strftime('%Y-%m-%d')
+    return None
 
-def create_html_content(title, source, link, description, config):
+def create_html_content(title, source, link, description, config, is_important=None):
     """
     Create HTML content for a news article.
     
@@ -148,6 +226,8 @@ def create_html_content(title, source, link, description, config):
         link (str): Article link/URL
         description (str): Article description/content
         config (dict): Configuration dictionary
+        is_important (bool): Whether the source is an important one, as
+            already determined during scoring (looked up in config if None)
     
     Returns:
         str: Formatted HTML content
@@ -155,7 +235,7 @@ def create_html_content(title, source, link, description, config):
     # Clean and format the description
     if description:
         # Split into paragraphs if there are line breaks
-        paragraphs = description.split('\n\n')
+        paragraphs = _PARAGRAPH_BREAK_RE.split(description)
         if len(paragraphs) == 1:
             paragraphs = description.split('. ')
             # Rejoin sentences that were split incorrectly
@@ -177,37 +257,193 @@ def create_html_content(title, source, link, description, config):
     else:
         formatted_paragraphs = ["No description available."]
     
-    # Get important sources from config
-    important_sources = config.get("important_sources", [])
-    
     # Create HTML content
-    html_content = f'<h2 class="text-32 mb-4 font-700 elite-bold">{title}</h2>\n'
+    parts = [f'<h2 class="text-32 mb-4 font-700 elite-bold">{escape(title)}</h2>\n']
     
     # Add source and link information if available
     if source or link:
-        html_content += '<div class="article-meta">\n'
+        parts.append('<div class="article-meta">\n')
         if source:
             # Check if this is an important source for special styling
-            is_important = any(imp_source.lower() in source.lower() for imp_source in important_sources)
+            if is_important is None:
+                important_sources = config.get("important_sources", [])
+                is_important = any(imp_source.lower() in source.lower() for imp_source in important_sources)
             source_class = 'source-important' if is_important else 'source'
             source_icon = '🔴' if is_important else '📰'
-            html_content += f'  <p class="{source_class}">{source_icon} <strong>Source:</strong> <span class="source-name">{source}</span></p>\n'
+            parts.append(f'  <p class="{source_class}">{source_icon} <strong>Source:</strong> <span class="source-name">{escape(source)}</span></p>\n')
         if link:
-            html_content += f'  <p class="link"><strong>Link:</strong> <a href="{link}" target="_blank">{link}</a></p>\n'
-        html_content += '</div>\n'
+            safe_link = escape(link)
+            parts.append(f'  <p class="link"><strong>Link:</strong> <a href="{safe_link}" target="_blank">{safe_link}</a></p>\n')
+        parts.append('</div>\n')
+    
+    parts.append('<div class="description">\n')
+    
+    # Blank paragraphs were already dropped while splitting above. Emphasis is
+    # applied in one pass over the whole block; the phrases cannot span the
+    # paragraph tags, so this matches a per-paragraph substitution.
+    paragraphs_html = ''.join(f'  <p>{escape(paragraph)}</p>\n' for paragraph in formatted_paragraphs)
+    parts.append(_EMPH_RE.sub(r'<span class="font-700">\1</span>', paragraphs_html))
+    
+    parts.append('</div>')
+    
+    return ''.join(parts)
+
+def write_file(file_path, data):
+    """
+    Write bytes to a file with a single low-level write.
+    
+    Bypasses the buffered text-file layer, which is pure overhead when the
+    whole payload is already in memory.
+    
+    Args:
+        file_path (Path): Destination file
+        data (bytes): Encoded file contents
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(file_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def write_json(file_path, data):
+    """
+    Write data to a file as indented UTF-8 JSON.
+    
+    Uses orjson when it is installed and falls back to the standard library.
+    
+    Args:
+        file_path (Path): Destination file
+        data (dict): JSON-serializable data
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    write_file(file_path, payload)
+
+def _render_article_file(task):
+    """
+    Render one article and write it to disk.
+    
+    Kept at module level so it can be pickled for worker processes. The
+    source styling is already decided during scoring, so no configuration
+    is sent to the workers.
+    
+    Args:
+        task (tuple): (file_path, title, source, link, description, is_important)
+    """
+    file_path, title, source, link, description, is_important = task
+    html_content = create_html_content(title, source, link, description, None, is_important)
+    write_file(file_path, html_content.encode('utf-8'))
+
+def read_excel_file(excel_file_path, columns=None):
+    """
+    Read an Excel file, loading only the requested columns.
+    
+    The sheet is parsed once: the usecols callable records every header name
+    while skipping unused columns, and the text columns are declared as
+    strings, which avoids pandas' type inference.
+    
+    Args:
+        excel_file_path (str): Path to the Excel file
+        columns (list): Column names to load (all columns if None)
+    
+    Returns:
+        tuple: (all column names in the sheet, DataFrame of the requested
+        columns that exist)
+    """
+    header = []
+    
+    def usecols(name):
+        header.append(name)
+        return columns is None or name in columns
+    
+    text_columns = ['Source', 'Title', 'Link', 'Description']
+    dtype = {col: str for col in text_columns}
+    
+    df = pd.read_excel(excel_file_path, usecols=usecols, dtype=dtype)
+    return tuple(header), df
+
+def _make_projection(positions):
+    """
+    Build a function that picks the given positions out of a row tuple.
+    
+    Args:
+        positions (list): Index into the row for each output field, or None
+            for fields that should always read as None
+    
+    Returns:
+        callable: Function mapping a row tuple to a tuple of len(positions)
+    """
+    if len(positions) > 1 and None not in positions:
+        return itemgetter(*positions)
+    
+    def project(row):
+        return tuple(row[i] if i is not None else None for i in positions)
+    return project
+
+def iter_excel_rows(excel_file_path, columns, formula_values=True):
+    """
+    Stream rows from the first worksheet of an Excel file.
     
-    html_content += '<div class="description">\n'
+    Modern workbooks are read with openpyxl in read-only mode, so no
+    DataFrame is ever built. Legacy formats fall back to pandas. Only the
+    requested columns are read.
     
-    for paragraph in formatted_paragraphs:
-        if paragraph.strip():
-            # Add emphasis to certain phrases
-            paragraph = re.sub(r'\b(What Happened|Why It Matters|Price Action|EXCLUSIVE|Breaking|Update)\b', 
-                             r'<span class="font-700">\1</span>', paragraph, flags=re.IGNORECASE)
-            html_content += f'  <p>{paragraph}</p>\n'
+    Args:
+        excel_file_path (str): Path to the Excel file
+        columns (list): Column names to extract, in output order
+        formula_values (bool): Read formula cells as the value Excel last
+            saved; when False they come back as their formula text
     
-    html_content += '</div>'
+    Yields:
+        tuple: The full header row first, then one tuple of values for
+        `columns` per non-empty row (empty cells and missing columns are None)
+    """
+    if Path(excel_file_path).suffix.lower() not in ('.xlsx', '.xlsm'):
+        header, df = read_excel_file(excel_file_path, columns)
+        yield header
+        
+        df = df.reindex(columns=columns).astype(object)
+        for row in df.where(df.notna(), None).itertuples(index=False, name=None):
+            if any(value is not None for value in row):
+                yield row
+        return
     
-    return html_content
+    wb = load_workbook(excel_file_path, read_only=True, data_only=formula_values)
+    try:
+        ws = wb.worksheets[0]
+        # Read-only mode trusts the stored <dimension> tag, which some exporters
+        # write wrong; recompute the extent from the cells instead
+        ws.reset_dimensions()
+        header = next(ws.iter_rows(max_row=1, values_only=True), ())
+        yield header
+        
+        # First occurrence wins for duplicated header names
+        column_index = {}
+        for i, name in enumerate(header):
+            column_index.setdefault(name, i)
+        positions = [column_index.get(col) for col in columns]
+        present = [i for i in positions if i is not None]
+        if not present:
+            return
+        
+        # Restrict the scan to the span of needed columns and re-base positions
+        first, last = min(present), max(present)
+        width = last - first + 1
+        project = _make_projection([i - first if i is not None else None for i in positions])
+        
+        for row in ws.iter_rows(min_row=2, min_col=first + 1, max_col=last + 1, values_only=True):
+            if len(row) < width:
+                row += (None,) * (width - len(row))
+            row = project(row)
+            if any(value is not None for value in row):
+                yield row
+    finally:
+        wb.close()
 
 def excel_to_news_directory(excel_file_path, output_directory="news-articles", max_articles=None, config_file="config.json"):
     """
@@ -232,7 +468,10 @@ def excel_to_news_directory(excel_file_path, output_directory="news-articles", m
         
         # Read the Excel file
         print(f"Reading Excel file: {excel_file_path}")
-        df = pd.read_excel(excel_file_path)
+        formula_values = config.get("input_settings", {}).get("formula_values", True)
+        required_columns = ['Date', 'Source', 'Title', 'Link', 'Description']
+        rows = iter_excel_rows(excel_file_path, required_columns, formula_values)
+        header = next(rows, ())
         
         # Create output directory
         output_path = Path(output_directory)
@@ -242,12 +481,11 @@ def excel_to_news_directory(excel_file_path, output_directory="news-articles", m
         print(f"🎯 Algorithm configured for {max_articles} articles")
         
         # Check if required columns exist
-        required_columns = ['Date', 'Source', 'Title', 'Link', 'Description']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in required_columns if col not in header]
         
         if missing_columns:
             print(f"Warning: Missing columns: {missing_columns}")
-            print(f"Available columns: {list(df.columns)}")
+            print(f"Available columns: {list(header)}")
             print("Proceeding with available columns...")
         
         # Get configuration values
@@ -259,114 +497,116 @@ def excel_to_news_directory(excel_file_path, output_directory="news-articles", m
         print(f"📰 Important sources: {len(important_sources)} configured")
         print(f"🔑 Importance keywords: {len(importance_keywords)} configured")
         
-        # Process and score articles
-        articles_data = []
+        # Resolve scoring settings once instead of on every row
+        max_points = recency_settings["recency_max_points"]
+        source_points = scoring_weights["source_credibility"]
+        keyword_points = scoring_weights["keyword_importance"]
+        content_quality = scoring_weights["content_quality"]
+        long_threshold = content_quality["long_threshold"]
+        medium_threshold = content_quality["medium_threshold"]
+        long_points = content_quality["long_description"]
+        medium_points = content_quality["medium_description"]
         
-        for index, row in df.iterrows():
-            try:
-                # Get date and format it
-                date_str = row.get('Date', '')
-                formatted_date = format_date_for_filename(date_str)
-                
-                # Parse date for sorting
+        # Sources and keywords are matched against upper-cased text, so
+        # normalize them once; the sources become one alternation that scans
+        # the source name in a single pass (None when no sources are configured)
+        sources_re = re.compile('|'.join(re.escape(imp_source.upper()) for imp_source in important_sources)) if important_sources else None
+        keywords_upper = tuple(keyword.upper() for keyword in importance_keywords)
+        
+        # One reference time for the whole run: recency, undated rows and the
+        # summary's export date
+        now = datetime.now()
+        
+        # Process and score articles lazily, so only the current row and the
+        # best max_articles candidates are held in memory
+        total_articles = 0
+        social_posts_skipped = 0
+        
+        def score_articles():
+            nonlocal total_articles, social_posts_skipped
+            for index, row in enumerate(rows):
                 try:
-                    if isinstance(date_str, str):
-                        # Use the same date formats as format_date_for_filename
-                        date_formats = [
-                            '%Y-%m-%d',           # 2025-08-06
-                            '%m/%d/%Y',           # 08/06/2025
-                            '%d/%m/%Y',           # 06/08/2025
-                            '%Y/%m/%d',           # 2025/08/06
-                            '%B %d, %Y',          # August 06, 2025
-                            '%B %d %Y',           # August 06 2025
-                            '%b %d, %Y',          # Aug 06, 2025
-                            '%b %d %Y',           # Aug 06 2025
-                            '%d %B %Y',           # 06 August 2025
-                            '%d %b %Y',           # 06 Aug 2025
-                            '%Y-%m-%d %H:%M:%S', # 2025-08-06 14:30:00
-                            '%m/%d/%Y %H:%M:%S', # 08/06/2025 14:30:00
-                        ]
-                        
-                        for fmt in date_formats:
-                            try:
-                                parsed_date = datetime.strptime(date_str, fmt)
-                                break
-                            except ValueError:
-                                continue
-                        else:
-                            parsed_date = datetime.now()
-                    elif isinstance(date_str, datetime):
-                        parsed_date = date_str
-                    else:
-                        parsed_date = datetime.now()
-                except:
-                    parsed_date = datetime.now()
-                
-                # Get title, source, link, and description
-                title = str(row.get('Title', f'Article {index + 1}'))
-                source = str(row.get('Source', ''))
-                link = str(row.get('Link', ''))
-                description = str(row.get('Description', ''))
-                
-                # Skip rows with "Social Media Post" in description
-                if 'Social Media Post' in description:
-                    print(f"Skipping row {index + 1}: Social Media Post detected in description")
+                    date_str, source, title, link, description = row
+                    
+                    # Skip rows with "Social Media Post" in description before doing any other work
+                    if isinstance(description, str) and 'Social Media Post' in description:
+                        social_posts_skipped += 1
+                        continue
+                    
+                    # Parse the date once; it provides both the sort key and the
+                    # file name date
+                    parsed_date = parse_date(date_str)
+                    if parsed_date is None:
+                        parsed_date = now
+                    formatted_date = parsed_date.strftime('%Y-%m-%d')
+                    
+                    # Get title, source, link, and description
+                    # Text cells are already str; only empty or non-text cells need converting
+                    if type(title) is not str:
+                        title = f'Article {index + 1}' if title is None else str(title)
+                    if type(source) is not str:
+                        source = '' if source is None else str(source)
+                    if type(link) is not str:
+                        link = '' if link is None else str(link)
+                    if type(description) is not str:
+                        description = '' if description is None else str(description)
+                    
+                    # Calculate importance score
+                    importance_score = 0
+                    
+                    # Date score (more recent = higher score)
+                    days_old = (now - parsed_date).days
+                    date_score = max(0, max_points - days_old)
+                    importance_score += date_score
+                    
+                    # Source importance score
+                    is_important = sources_re is not None and sources_re.search(source.upper()) is not None
+                    if is_important:
+                        importance_score += source_points
+                    
+                    # Keyword importance score
+                    title_upper = title.upper()
+                    desc_upper = description.upper()
+                    keyword_count = sum(1 for keyword in keywords_upper if keyword in title_upper or keyword in desc_upper)
+                    importance_score += keyword_count * keyword_points
+                    
+                    # Content length score (longer descriptions might indicate more detailed/important news)
+                    content_length = len(description)
+                    if content_length > long_threshold:
+                        importance_score += long_points
+                    elif content_length > medium_threshold:
+                        importance_score += medium_points
+                    
+                    # Yield article data with score
+                    total_articles += 1
+                    yield {
+                        'index': index,
+                        'date': parsed_date,
+                        'formatted_date': formatted_date,
+                        'title': title,
+                        'source': source,
+                        'is_important': is_important,
+                        'link': link,
+                        'description': description,
+                        'importance_score': importance_score
+                    }
+                    
+                except Exception as e:
+                    print(f"Error processing row {index + 1}: {str(e)}")
                     continue
-                
-                # Calculate importance score
-                importance_score = 0
-                
-                # Date score (more recent = higher score)
-                days_old = (datetime.now() - parsed_date).days
-                max_days = recency_settings["recency_max_days"]
-                max_points = recency_settings["recency_max_points"]
-                date_score = max(0, max_points - days_old)
-                importance_score += date_score
-                
-                # Source importance score
-                source_upper = source.upper()
-                if any(imp_source.upper() in source_upper for imp_source in important_sources):
-                    importance_score += scoring_weights["source_credibility"]
-                
-                # Keyword importance score
-                title_upper = title.upper()
-                desc_upper = description.upper()
-                keyword_count = sum(1 for keyword in importance_keywords if keyword in title_upper or keyword in desc_upper)
-                importance_score += keyword_count * scoring_weights["keyword_importance"]
-                
-                # Content length score (longer descriptions might indicate more detailed/important news)
-                content_length = len(description)
-                long_threshold = scoring_weights["content_quality"]["long_threshold"]
-                medium_threshold = scoring_weights["content_quality"]["medium_threshold"]
-                
-                if content_length > long_threshold:
-                    importance_score += scoring_weights["content_quality"]["long_description"]
-                elif content_length > medium_threshold:
-                    importance_score += scoring_weights["content_quality"]["medium_description"]
-                
-                # Store article data with score
-                articles_data.append({
-                    'index': index,
-                    'date': parsed_date,
-                    'formatted_date': formatted_date,
-                    'title': title,
-                    'source': source,
-                    'link': link,
-                    'description': description,
-                    'importance_score': importance_score
-                })
-                
-            except Exception as e:
-                print(f"Error processing row {index + 1}: {str(e)}")
-                continue
-        
-        # Sort articles by importance score (descending) and then by date (descending)
-        articles_data.sort(key=lambda x: (x['importance_score'], x['date']), reverse=True)
-        
-        # Take only the top max_articles
-        selected_articles = articles_data[:max_articles]
-        
-        print(f"Selected {len(selected_articles)} articles out of {len(articles_data)} total articles")
+        
+        # Keep the top max_articles by importance score and then by date (both
+        # descending); nlargest matches a stable descending sort truncated to N
+        scored_articles = score_articles()
+        selected_articles = heapq.nlargest(max(max_articles, 0), scored_articles,
+                                           key=lambda x: (x['importance_score'], x['date']))
+        for _ in scored_articles:
+            pass  # nlargest stops early when max_articles is 0; finish counting rows
+        
+        if social_posts_skipped:
+            print(f"Skipped {social_posts_skipped} rows: Social Media Post detected in description")
+        
+        print(f"Selected {len(selected_articles)} articles out of {total_articles} total articles")
         print("Articles selected based on importance score and recency")
         
         # Group articles by date for file naming
@@ -374,36 +614,40 @@ def excel_to_news_directory(excel_file_path, output_directory="news-articles", m
         file_list = []
         
         for article in selected_articles:
-            # Create filename
-            if article['formatted_date'] not in articles_by_date:
-                articles_by_date[article['formatted_date']] = 1
-            else:
-                articles_by_date[article['formatted_date']] += 1
-            
-            sequence_num = articles_by_date[article['formatted_date']]
-            filename = f"{article['formatted_date']}-{sequence_num:02d}.html"
-            
-            # Create HTML content
-            html_content = create_html_content(article['title'], article['source'], article['link'], article['description'], config)
-            
-            # Write HTML file
-            file_path = output_path / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            file_list.append(filename)
-            print(f"Created: {filename} (Score: {article['importance_score']}, Date: {article['formatted_date']})")
-        
-        # Create article configuration file
-        config_content = f"""const articleConfigs = {{
-  files: [
-    {', '.join([f"'{file}'" for file in sorted(file_list, reverse=True)])}
-  ]
-}};"""
+            # Create filename from the running per-date sequence number
+            formatted_date = article['formatted_date']
+            sequence_num = articles_by_date.get(formatted_date, 0) + 1
+            articles_by_date[formatted_date] = sequence_num
+            file_list.append(f"{formatted_date}-{sequence_num:02d}.html")
+        
+        # Render and write HTML files; every article is independent, so large
+        # batches are spread across worker processes
+        tasks = [
+            (output_path / filename, article['title'], article['source'], article['link'], article['description'], article['is_important'])
+            for filename, article in zip(file_list, selected_articles)
+        ]
+        if len(tasks) >= PARALLEL_MIN_ARTICLES:
+            with ProcessPoolExecutor() as executor:
+                for _ in executor.map(_render_article_file, tasks, chunksize=64):
+                    pass
+        else:
+            for task in tasks:
+                _render_article_file(task)
+        
+        # Report all created files with a single write rather than one print per file
+        if file_list:
+            sys.stdout.write(''.join(
+                f"Created: {filename} (Score: {article['importance_score']}, Date: {article['formatted_date']})\n"
+                for filename, article in zip(file_list, selected_articles)
+            ))
+        
+        # Create article configuration file; a JSON array of strings is a valid
+        # JS array literal, indented one more level to nest under "files"
+        files_json = json.dumps(sorted(file_list, reverse=True), indent=2).replace('\n', '\n  ')
+        config_content = f"const articleConfigs = {{\n  files: {files_json}\n}};"
         
         config_file_path = output_path / "article-config.js"
-        with open(config_file_path, 'w', encoding='utf-8') as f:
-            f.write(config_content)
+        write_file(config_file_path, config_content.encode('utf-8'))
         
         print(f"\nCreated configuration file: article-config.js")
         
@@ -411,7 +655,7 @@ def excel_to_news_directory(excel_file_path, output_directory="news-articles", m
         summary = {
             "source_file": excel_file_path,
             "output_directory": str(output_path),
-            "total_articles_processed": len(articles_data),
+            "total_articles_processed": total_articles,
             "articles_selected": len(selected_articles),
             "max_articles_limit": max_articles,
             "date_range": {
@@ -419,7 +663,7 @@ def excel_to_news_directory(excel_file_path, output_directory="news-articles", m
                 "latest": max(articles_by_date.keys()) if articles_by_date else None
             },
             "files_created": file_list,
-            "export_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "export_date": now.strftime('%Y-%m-%d %H:%M:%S'),
             "selection_criteria": "Most recent and most important news based on source credibility, keywords, and content quality",
             "config_used": config_file,
             "algorithm_settings": {
@@ -431,14 +675,13 @@ def excel_to_news_directory(excel_file_path, output_directory="news-articles", m
         
         # Save summary as JSON
         summary_file_path = output_path / "conversion-summary.json"
-        with open(summary_file_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        write_json(summary_file_path, summary)
         
         print(f"\n✅ Successfully converted {len(file_list)} articles to news directory structure!")
         print(f"📁 Output directory: {output_path}")
         print(f"📄 Configuration file: article-config.js")
         print(f"📊 Summary file: conversion-summary.json")
-        print(f"🎯 Selected {len(selected_articles)} most important articles out of {len(articles_data)} total")
+        print(f"🎯 Selected {len(selected_articles)} most important articles out of {total_articles} total")
         print(f"⚙️  Configuration loaded from: {config_file}")
         
         return summary